@@ -26,6 +26,8 @@ from logging import getLogger
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from xml.etree.ElementTree import Element  # noqa
 
+# The Updates.xml metadata comes from mirrors we do not control, so it is
+# parsed with defusedxml rather than a faster parser without those protections.
 from defusedxml import ElementTree
 
 from aqt.exceptions import ArchiveDownloadError, ArchiveListError, ChecksumDownloadFailure, NoPackageFound
@@ -19,6 +19,7 @@
 # IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 import binascii
+import functools
 import hashlib
 import logging.config
 import os
@@ -29,6 +30,7 @@ import shutil
 import subprocess
 import sys
 import uuid
+from concurrent.futures import Future
 from configparser import ConfigParser
 from logging import Handler, getLogger
 from logging.handlers import QueueListener
@@ -53,6 +55,15 @@ from aqt.exceptions import (
 )
 
 
+# Size of the chunks streamed from the server when downloading binary files.
+# Larger chunks reduce per-chunk Python overhead on fast mirrors.
+DOWNLOAD_CHUNK_SIZE = 65536
+
+# Userspace buffer for the archive being written to disk; chunks are coalesced
+# into megabyte-sized write syscalls instead of one syscall per chunk.
+DOWNLOAD_WRITE_BUFFER_SIZE = 1048576
+
+
 def get_os_name() -> str:
     system = sys.platform.lower()
     if system == "darwin":
@@ -180,6 +191,23 @@ def _check_content_type(ct: str) -> bool:
     return any(ct.startswith(t) for t in candidate)
 
 
+@functools.lru_cache(maxsize=4)
+def _get_session(total_retries: int, backoff_factor: float) -> requests.sessions.Session:
+    """
+    A process-wide session with retrying adapters.
+
+    Reusing one session keeps connections to the download server alive, so
+    consecutive requests skip the TCP/TLS handshake. Keyed on the retry
+    parameters so a Settings change yields a fresh session.
+    """
+    session = requests.sessions.Session()
+    retries = requests.adapters.Retry(total=total_retries, backoff_factor=backoff_factor)
+    adapter = requests.adapters.HTTPAdapter(max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 def getUrl(url: str, timeout: Tuple[float, float], expected_hash: Optional[bytes] = None) -> str:
     """
     Gets a file from `url` via HTTP GET.
@@ -188,90 +216,81 @@ def getUrl(url: str, timeout: Tuple[float, float], expected_hash: Optional[bytes
     the caller is `get_hash`, which cannot know what the expected hash should be.
     """
     logger = getLogger("aqt.helper")
-    with requests.sessions.Session() as session:
-        retries = requests.adapters.Retry(
-            total=Settings.max_retries_on_connection_error, backoff_factor=Settings.backoff_factor
+    session = _get_session(Settings.max_retries_on_connection_error, Settings.backoff_factor)
+    try:
+        r = session.get(url, allow_redirects=False, timeout=timeout)
+        num_redirects = 0
+        while 300 < r.status_code < 309 and num_redirects < 10:
+            num_redirects += 1
+            logger.debug("Asked to redirect({}) to: {}".format(r.status_code, r.headers["Location"]))
+            newurl = altlink(r.url, r.headers["Location"])
+            logger.info("Redirected: {}".format(urlparse(newurl).hostname))
+            r = session.get(newurl, stream=True, timeout=timeout)
+    except (
+        ConnectionResetError,
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+    ) as e:
+        raise ArchiveConnectionError(f"Failure to connect to {url}: {type(e).__name__}") from e
+    else:
+        if r.status_code != 200:
+            msg = f"Failed to retrieve file at {url}\nServer response code: {r.status_code}, reason: {r.reason}"
+            raise ArchiveDownloadError(msg)
+    result: str = r.text
+    filename = url.split("/")[-1]
+    if Settings.hash_algorithm not in ("sha256", "sha1", "md5"):
+        raise ArchiveChecksumError(f"Unknown hash algorithm: {Settings.hash_algorithm}.\nPlease check settings.ini")
+    actual_hash = hashlib.new(Settings.hash_algorithm, bytes(result, "utf-8"), usedforsecurity=False).digest()
+    if expected_hash is not None and expected_hash != actual_hash:
+        raise ArchiveChecksumError(
+            f"Downloaded file {filename} is corrupted! Detect checksum error.\n"
+            f"Expect {expected_hash.hex()}: {url}\n"
+            f"Actual {actual_hash.hex()}: {filename}"
         )
-        adapter = requests.adapters.HTTPAdapter(max_retries=retries)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        try:
-            r = session.get(url, allow_redirects=False, timeout=timeout)
-            num_redirects = 0
-            while 300 < r.status_code < 309 and num_redirects < 10:
-                num_redirects += 1
-                logger.debug("Asked to redirect({}) to: {}".format(r.status_code, r.headers["Location"]))
-                newurl = altlink(r.url, r.headers["Location"])
-                logger.info("Redirected: {}".format(urlparse(newurl).hostname))
-                r = session.get(newurl, stream=True, timeout=timeout)
-        except (
-            ConnectionResetError,
-            requests.exceptions.ConnectionError,
-            requests.exceptions.Timeout,
-        ) as e:
-            raise ArchiveConnectionError(f"Failure to connect to {url}: {type(e).__name__}") from e
-        else:
-            if r.status_code != 200:
-                msg = f"Failed to retrieve file at {url}\nServer response code: {r.status_code}, reason: {r.reason}"
-                raise ArchiveDownloadError(msg)
-        result: str = r.text
-        filename = url.split("/")[-1]
-        if Settings.hash_algorithm == "sha256":
-            actual_hash = hashlib.sha256(bytes(result, "utf-8"), usedforsecurity=False).digest()
-        elif Settings.hash_algorithm == "sha1":
-            actual_hash = hashlib.sha1(bytes(result, "utf-8"), usedforsecurity=False).digest()
-        elif Settings.hash_algorithm == "md5":
-            actual_hash = hashlib.md5(bytes(result, "utf-8"), usedforsecurity=False).digest()
-        else:
-            raise ArchiveChecksumError(f"Unknown hash algorithm: {Settings.hash_algorithm}.\nPlease check settings.ini")
-        if expected_hash is not None and expected_hash != actual_hash:
-            raise ArchiveChecksumError(
-                f"Downloaded file {filename} is corrupted! Detect checksum error.\n"
-                f"Expect {expected_hash.hex()}: {url}\n"
-                f"Actual {actual_hash.hex()}: {filename}"
-            )
     return result
 
 
-def downloadBinaryFile(url: str, out: Path, hash_algo: str, exp: Optional[bytes], timeout: Tuple[float, float]) -> None:
+def downloadBinaryFile(
+    url: str, out: Path, hash_algo: str, exp: Union[None, bytes, "Future[bytes]"], timeout: Tuple[float, float]
+) -> None:
     logger = getLogger("aqt.helper")
     filename = Path(url).name
-    with requests.sessions.Session() as session:
-        retries = requests.adapters.Retry(
-            total=Settings.max_retries_on_connection_error, backoff_factor=Settings.backoff_factor
-        )
-        adapter = requests.adapters.HTTPAdapter(max_retries=retries)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+    session = _get_session(Settings.max_retries_on_connection_error, Settings.backoff_factor)
+    try:
+        r = session.get(url, allow_redirects=False, stream=True, timeout=timeout)
+        if 300 < r.status_code < 309:
+            logger.debug("Asked to redirect({}) to: {}".format(r.status_code, r.headers["Location"]))
+            newurl = altlink(r.url, r.headers["Location"])
+            logger.info("Redirected: {}".format(urlparse(newurl).hostname))
+            r = session.get(newurl, stream=True, timeout=timeout)
+    except requests.exceptions.ConnectionError as e:
+        raise ArchiveConnectionError(f"Connection error: {e.args}") from e
+    except requests.exceptions.Timeout as e:
+        raise ArchiveConnectionError(f"Connection timeout: {e.args}") from e
+    else:
+        # Hash each chunk as it arrives so the file is never re-read
+        # from disk just to verify its checksum.
+        hash = hashlib.new(hash_algo, usedforsecurity=False)
         try:
-            r = session.get(url, allow_redirects=False, stream=True, timeout=timeout)
-            if 300 < r.status_code < 309:
-                logger.debug("Asked to redirect({}) to: {}".format(r.status_code, r.headers["Location"]))
-                newurl = altlink(r.url, r.headers["Location"])
-                logger.info("Redirected: {}".format(urlparse(newurl).hostname))
-                r = session.get(newurl, stream=True, timeout=timeout)
-        except requests.exceptions.ConnectionError as e:
-            raise ArchiveConnectionError(f"Connection error: {e.args}") from e
-        except requests.exceptions.Timeout as e:
-            raise ArchiveConnectionError(f"Connection timeout: {e.args}") from e
-        else:
-            hash = hashlib.new(hash_algo, usedforsecurity=False)
-            try:
-                with open(out, "wb") as fd:
-                    for chunk in r.iter_content(chunk_size=8196):
-                        fd.write(chunk)
-                        hash.update(chunk)
-                    fd.flush()
-            except requests.exceptions.ReadTimeout as e:
-                raise ArchiveConnectionError(f"Read timeout: {e.args}") from e
-            except Exception as e:
-                raise ArchiveDownloadError(f"Download of {filename} has error: {e}") from e
-            if exp is not None and hash.digest() != exp:
-                raise ArchiveChecksumError(
-                    f"Downloaded file {filename} is corrupted! Detect checksum error.\n"
-                    f"Expect {exp.hex()}: {url}\n"
-                    f"Actual {hash.digest().hex()}: {out.name}"
-                )
+            with open(out, "wb", buffering=DOWNLOAD_WRITE_BUFFER_SIZE) as fd:
+                for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    fd.write(chunk)
+                    hash.update(chunk)
+                fd.flush()
+        except requests.exceptions.ReadTimeout as e:
+            raise ArchiveConnectionError(f"Read timeout: {e.args}") from e
+        except Exception as e:
+            raise ArchiveDownloadError(f"Download of {filename} has error: {e}") from e
+        if isinstance(exp, Future):
+            # The expected hash may still be in flight; wait for it only now
+            # that the archive itself has finished downloading.
+            exp = exp.result()
+        if exp is not None and hash.digest() != exp:
+            raise ArchiveChecksumError(
+                f"Downloaded file {filename} is corrupted! Detect checksum error.\n"
+                f"Expect {exp.hex()}: {url}\n"
+                f"Actual {hash.digest().hex()}: {out.name}"
+            )
 
 
 def retry_on_errors(action: Callable[[], Any], acceptable_errors: Tuple, num_retries: int, name: str) -> Any:
@@ -309,6 +328,15 @@ def iter_list_reps(_list: List, num_reps: int) -> Generator:
             list_index = 0
 
 
+def get_file_hash(path: Path, algorithm: str) -> bytes:
+    """Compute the checksum of a file already on disk, reading it in large chunks."""
+    hash = hashlib.new(algorithm, usedforsecurity=False)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_WRITE_BUFFER_SIZE), b""):
+            hash.update(chunk)
+    return hash.digest()
+
+
 def get_hash(archive_path: str, algorithm: str, timeout: Tuple[float, float]) -> bytes:
     """
     Downloads a checksum and unhexlifies it to a `bytes` object, guaranteed to be the right length.
@@ -384,13 +412,15 @@ class MyQueueListener(QueueListener):
 
     def handle(self, record) -> None:
         """
-        Handle a record from subprocess.
+        Handle a record, or a batch of records, from subprocess.
         Override logger name then handle at proper logger.
         """
-        record = self.prepare(record)
+        records = record if isinstance(record, list) else [record]
         logger = getLogger("aqt.installer")
-        record.name = "aqt.installer"
-        logger.handle(record)
+        for rec in records:
+            rec = self.prepare(rec)
+            rec.name = "aqt.installer"
+            logger.handle(rec)
 
 
 def ssplit(data: str) -> Generator[str, None, None]:
@@ -565,6 +595,11 @@ class SettingsClass:
     def archive_download_location(self):
         return self.config.get("aqt", "archive_download_location", fallback=".")
 
+    @property
+    def download_cache_location(self):
+        """Directory of a persistent download cache; an empty value disables caching."""
+        return self.config.get("aqt", "download_cache_location", fallback="")
+
     @property
     def always_keep_archives(self):
         return self.config.getboolean("aqt", "always_keep_archives", fallback=False)
@@ -642,6 +677,21 @@ class SettingsClass:
     def zipcmd(self):
         return self.config.get("aqt", "7zcmd", fallback="7z")
 
+    @property
+    def prefer_external_7z(self):
+        """Use the external 7z command for .7z extraction even when py7zr is available."""
+        return self.config.getboolean("aqt", "prefer_external_7z", fallback=False)
+
+    @property
+    def prefer_system_tar(self):
+        """Use the system tar command for tar extraction instead of the tarfile module."""
+        return self.config.getboolean("aqt", "prefer_system_tar", fallback=False)
+
+    @property
+    def force_pure_python_extractor(self):
+        """Use the pure-Python extractors even when the libarchive module is available."""
+        return self.config.getboolean("aqt", "force_pure_python_extractor", fallback=False)
+
     @property
     def kde_patches(self):
         return self.config.getlist("kde_patches", "patches", fallback=[])
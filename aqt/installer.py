@@ -23,23 +23,26 @@
 
 import argparse
 import errno
+import functools
 import gc
+import mmap
 import multiprocessing
 import os
 import platform
-import posixpath
 import re
+import shutil
 import signal
 import subprocess
 import sys
 import tarfile
 import time
 import zipfile
-from logging import getLogger
+from concurrent.futures import ThreadPoolExecutor
+from logging import LogRecord, getLogger
 from logging.handlers import QueueHandler
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from tempfile import TemporaryDirectory
-from typing import List, Optional, Tuple, cast
+from typing import Callable, Dict, List, Optional, Set, Tuple, cast
 
 import aqt
 from aqt.archives import QtArchives, QtPackage, SrcDocExamplesArchives, ToolArchives
@@ -62,6 +65,7 @@ from aqt.helper import (
     download_installer,
     downloadBinaryFile,
     extract_auth,
+    get_file_hash,
     get_hash,
     get_os_name,
     get_qt_installer_name,
@@ -82,6 +86,320 @@ try:
 except ImportError:
     EXT7Z = True
 
+try:
+    import libarchive
+    import libarchive.extract
+
+    LIBARCHIVE = True
+except ImportError:
+    LIBARCHIVE = False
+
+# Compiled once at import; matches the URL schemes accepted for --base mirrors.
+_MIRROR_SCHEME_RE = re.compile(r"^(?:https?|ftp)://")
+
+# Shared argparse choices for the positional host/target arguments.
+_HOST_CHOICES = ("linux", "linux_arm64", "mac", "windows", "windows_arm64", "all_os")
+_TARGET_CHOICES = ("desktop", "winrt", "android", "ios", "wasm", "qt")
+
+# Large help texts, kept at module level so the parser builders stay readable.
+_INSTALL_QT_ARCH_HELP = (
+    "\ntarget linux/desktop: linux_gcc_64, gcc_64, wasm_32"
+    "\ntarget mac/desktop:   clang_64, wasm_32"
+    "\ntarget mac/ios:       ios"
+    "\nwindows/desktop:      win64_msvc2022_64"
+    "\n                      win64_msvc2019_64, win32_msvc2019"
+    "\n                      win64_msvc2017_64, win32_msvc2017"
+    "\n                      win64_msvc2015_64, win32_msvc2015"
+    "\n                      win64_mingw81, win32_mingw81"
+    "\n                      win64_mingw73, win32_mingw73"
+    "\n                      win32_mingw53"
+    "\n                      wasm_32"
+    "\nwindows/winrt:        win64_msvc2019_winrt_x64, win64_msvc2019_winrt_x86"
+    "\n                      win64_msvc2017_winrt_x64, win64_msvc2017_winrt_x86"
+    "\n                      win64_msvc2019_winrt_armv7"
+    "\n                      win64_msvc2017_winrt_armv7"
+    "\nandroid:              Qt 5.14:          android (optional)"
+    "\n                      Qt 5.13 or below: android_x86_64, android_arm64_v8a"
+    "\n                                        android_x86, android_armv7"
+    "\nall_os/wasm:          wasm_singlethread, wasm_multithread"
+)
+_LIST_QT_EPILOG = (
+    "Examples:\n"
+    "$ aqt list-qt mac                                                # print all targets for Mac OS\n"
+    "$ aqt list-qt mac desktop                                        # print all versions of Qt 5\n"
+    '$ aqt list-qt mac desktop --spec "5.9"                           # print all versions of Qt 5.9\n'
+    '$ aqt list-qt mac desktop --spec "5.9" --latest-version          # print latest Qt 5.9\n'
+    "$ aqt list-qt mac desktop --modules 5.12.0 clang_64              # print modules for 5.12.0\n"
+    "$ aqt list-qt mac desktop --spec 5.9 --modules latest clang_64   # print modules for latest 5.9\n"
+    "$ aqt list-qt mac desktop --arch 5.9.9                           # print architectures for "
+    "5.9.9/mac/desktop\n"
+    "$ aqt list-qt mac desktop --arch latest                          # print architectures for the "
+    "latest Qt 5\n"
+    "$ aqt list-qt mac desktop --archives 5.9.0 clang_64              # list archives in base Qt "
+    "installation\n"
+    "$ aqt list-qt mac desktop --archives 5.14.0 clang_64 debug_info  # list archives in debug_info "
+    "module\n"
+    "$ aqt list-qt all_os wasm --arch 6.8.1                           # print architectures for Qt WASM "
+    "6.8.1\n"
+)
+_LIST_TOOL_EPILOG = (
+    "Examples:\n"
+    "$ aqt list-tool mac desktop                   # print all tools for mac desktop\n"
+    "$ aqt list-tool mac desktop tools_ifw         # print all tool variant names for QtIFW\n"
+    "$ aqt list-tool mac desktop ifw               # print all tool variant names for QtIFW\n"
+    "$ aqt list-tool mac desktop tools_ifw --long  # print tool variant names with metadata for QtIFW\n"
+    "$ aqt list-tool mac desktop ifw --long        # print tool variant names with metadata for QtIFW\n"
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _sevenzip_available(sevenzip: str) -> bool:
+    """Check once per process whether the given 7zip command is on PATH."""
+    return shutil.which(sevenzip) is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_installer_name() -> str:
+    """get_qt_installer_name fetches the online installer listing; do it once per process."""
+    return get_qt_installer_name()
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_os_name() -> str:
+    """get_os_name probes the platform, which never changes within a process."""
+    return get_os_name()
+
+
+def _system_tar_command(archive: Path, base_dir: str) -> Optional[List[str]]:
+    """
+    Build an external tar extraction command for the archive, or return None
+    to extract with the tarfile module.
+
+    Only used when Settings.prefer_system_tar is enabled and tar is on PATH.
+    Parallel decompressors (pigz, lbzip2/pbzip2) are used when available.
+    """
+    if not Settings.prefer_system_tar or not _sevenzip_available("tar"):
+        return None
+    command_args = ["tar", "-xf", str(archive), "-C", base_dir]
+    decompressors = {".gz": ("pigz",), ".tgz": ("pigz",), ".bz2": ("lbzip2", "pbzip2")}
+    for decompressor in decompressors.get(archive.suffix, ()):
+        if _sevenzip_available(decompressor):
+            command_args[1:1] = ["--use-compress-program", decompressor]
+            break
+    return command_args
+
+
+_ARCHIVE_KIND_BY_SUFFIX = {
+    ".7z": "7z",
+    ".zip": "zip",
+    ".tar": "tar",
+    ".tar.gz": "tar",
+    ".tgz": "tar",
+    ".tar.bz2": "tar",
+    ".tbz2": "tar",
+    ".tar.xz": "tar",
+    ".txz": "tar",
+}
+
+
+# Leading signatures of the formats we extract; compressed streams other than
+# .7z and .zip only ever hold tars in the Qt feeds.
+_ARCHIVE_KIND_BY_MAGIC = (
+    (b"7z\xbc\xaf\x27\x1c", "7z"),
+    (b"PK\x03\x04", "zip"),
+    (b"\x1f\x8b", "tar"),  # gzip
+    (b"\xfd7zXZ\x00", "tar"),  # xz
+    (b"BZh", "tar"),  # bzip2
+)
+
+
+def _archive_kind(archive: Path) -> str:
+    """
+    Classify an archive by its filename suffix, which the Qt feeds provide
+    up front, avoiding magic-byte probe reads of the downloaded file.
+    Files with an unrecognized suffix are sniffed with a single read.
+    """
+    name = archive.name.lower()
+    for suffix, kind in _ARCHIVE_KIND_BY_SUFFIX.items():
+        if name.endswith(suffix):
+            return kind
+    try:
+        with open(archive, "rb") as f:
+            head = f.read(262)
+    except OSError:
+        head = b""
+    for magic, kind in _ARCHIVE_KIND_BY_MAGIC:
+        if head.startswith(magic):
+            return kind
+    if head[257:262] == b"ustar":
+        return "tar"
+    # Ambiguous header (e.g. a pre-POSIX tar): let the libraries decide.
+    if tarfile.is_tarfile(archive):
+        return "tar"
+    if zipfile.is_zipfile(archive):
+        return "zip"
+    return "7z"
+
+
+def _extract_with_libarchive(archive: Path, base_dir: str) -> None:
+    """
+    Extract via the C libarchive library, which decompresses far faster than
+    the pure-Python extractors. Only called when the libarchive module loaded.
+    """
+    flags = (
+        libarchive.extract.EXTRACT_SECURE_NODOTDOT
+        | libarchive.extract.EXTRACT_SECURE_SYMLINKS
+        | libarchive.extract.EXTRACT_SECURE_NOABSOLUTEPATHS
+    )
+    archive_path = str(archive.resolve())
+    os.makedirs(base_dir, exist_ok=True)
+    # libarchive extracts into the working directory.
+    cwd = os.getcwd()
+    os.chdir(base_dir)
+    try:
+        libarchive.extract_file(archive_path, flags=flags)
+    finally:
+        os.chdir(cwd)
+
+
+def _precreate_dirs(member_names, base_dir: str) -> None:
+    """
+    Create every directory an archive extracts into, one mkdir per unique path.
+
+    The extractors otherwise probe and create directories member by member;
+    large Qt archives hold tens of thousands of members, nearly all sharing a
+    few hundred parents. Suspicious members (absolute or dot-dot paths) are
+    left for the extractor's own safety filters to reject.
+    """
+    parents = set()
+    for name in member_names:
+        parent = PurePosixPath(name).parent
+        if not parent.is_absolute() and ".." not in parent.parts:
+            parents.add(str(parent))
+    for parent in sorted(parents):
+        os.makedirs(os.path.join(base_dir, parent), exist_ok=True)
+
+
+class _SeekableMmap(mmap.mmap):
+    """
+    Read-only archive mapping usable as a fileobj by tarfile and zipfile.
+    mmap itself only grew the io inspection methods in Python 3.13.
+    """
+
+    def seekable(self) -> bool:
+        return True
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return False
+
+
+def _archive_fileobj(f):
+    """
+    Return the best read handle for an open archive: a shared read-only mmap,
+    or the plain file object on 32-bit interpreters (and on mapping failure),
+    where address space is too scarce to map a multi-GB archive.
+    """
+    if not is_64bit():
+        return f
+    try:
+        return _SeekableMmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        return f
+
+
+def _extract_zip_members(zip_archive, base_dir: str) -> None:
+    """
+    Extract every member of a zip archive, streaming file data with a 4 MiB
+    buffer instead of shutil's 16 KiB default so large Qt libraries are
+    written with far fewer syscalls. Unlike ZipFile.extractall, which sets no
+    permissions at all, the unix mode bits stored in the archive are applied —
+    masked to the plain rwx bits so a mirror-supplied archive cannot create
+    setuid binaries, matching the posture of the tar branch's "tar" filter.
+    """
+    for info in zip_archive.infolist():
+        member = PurePosixPath(info.filename)
+        if member.is_absolute() or ".." in member.parts:
+            raise ArchiveExtractionError(f"Invalid member path in zip archive: {info.filename}")
+        dest = os.path.join(base_dir, *member.parts)
+        if info.is_dir():
+            os.makedirs(dest, exist_ok=True)
+            continue
+        with zip_archive.open(info) as src, open(dest, "wb") as dst:
+            shutil.copyfileobj(src, dst, 1 << 22)
+        mode = (info.external_attr >> 16) & 0o777
+        if mode:
+            os.chmod(dest, mode)
+
+
+_SIZE_RE = re.compile(r"Size:\s*([0-9]+(?:\.[0-9]+)?)\s*([KMGT]?)", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+
+def _estimated_archive_size(qt_package: QtPackage) -> float:
+    """Best-effort archive size in bytes, parsed from the package description; 0 when unknown."""
+    match = _SIZE_RE.search(qt_package.package_desc or "")
+    if match is None:
+        return 0.0
+    return float(match.group(1)) * _SIZE_UNITS[match.group(2).upper()]
+
+
+def _drop_page_cache(path: Path) -> None:
+    """Hint the kernel that a file's cached pages will not be needed again."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def _run_extraction_command(command_args: List[str], logger) -> None:
+    """Run an external extraction tool, raising ArchiveExtractionError on failure."""
+    try:
+        proc = subprocess.run(command_args, capture_output=True, check=True, text=True)
+        logger.debug(proc.stdout)
+    except subprocess.CalledProcessError as cpe:
+        msg = "\n".join(filter(None, [f"Extraction error: {cpe.returncode}", cpe.stdout, cpe.stderr]))
+        raise ArchiveExtractionError(msg) from cpe
+
+
+@functools.lru_cache(maxsize=128)
+def _try_parse_version(version_str: str) -> Optional[Version]:
+    """Parse a version string once per process; returns None for specs and garbage."""
+    try:
+        return Version(version_str)
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _check_version_str(
+    version_str: Optional[str], allow_latest: bool, allow_empty: bool, allow_minus: bool
+) -> Optional[str]:
+    """
+    Memoized core of Cli._validate_version_str: returns an error message for an
+    unacceptable version, or None. The same few versions are checked repeatedly
+    within one run, and Version() parsing is regex-heavy.
+    """
+    if allow_latest and version_str == "latest":
+        return None
+    if not version_str:
+        if allow_empty:
+            return None
+        return "Invalid empty version! Please use the form '5.X.Y'."
+    if "-" in version_str and allow_minus:
+        version_str = version_str[: version_str.find("-")]
+    if _try_parse_version(version_str) is None:
+        return f"Invalid version: '{version_str}'! Please use the form '5.X.Y'."
+    return None
+
 
 class BaseArgumentParser(argparse.ArgumentParser):
     """Global options and subcommand trick"""
@@ -165,6 +483,46 @@ class InstallToolArgParser(CommonInstallArgParser):
     tool_variant: Optional[str]
 
 
+class BatchingQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records in batches.
+
+    Each queue put from a worker is a pickle plus an IPC round trip; buffering
+    prepared records locally and sending them as one list amortizes that cost
+    over many records. MyQueueListener accepts either a record or a list.
+    """
+
+    def __init__(self, queue, batch_size: int = 64) -> None:
+        super().__init__(queue)
+        self._batch_size = batch_size
+        self._buffer: List[LogRecord] = []
+
+    def emit(self, record: LogRecord) -> None:
+        try:
+            self._buffer.append(self.prepare(record))
+            if len(self._buffer) >= self._batch_size:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        if self._buffer:
+            self.enqueue(self._buffer)
+            self._buffer = []
+
+    def close(self) -> None:
+        self.flush()
+        super().close()
+
+
+class _ConditionalRequiredAction(argparse.Action):
+    """Stores a positional only when --override is absent, so override mode can omit it."""
+
+    def __call__(self, parser, namespace, values, option_string=None) -> None:
+        if not hasattr(namespace, "override") or not namespace.override:
+            setattr(namespace, self.dest, values)
+
+
 class Cli:
     """CLI main class to parse command line argument and launch proper functions."""
 
@@ -185,19 +543,59 @@ class Cli:
             type=argparse.FileType("r"),
             help="Configuration ini file.",
         )
-        subparsers = parser.add_subparsers(
+        self._subparsers = parser.add_subparsers(
             title="subcommands",
             description="aqt accepts several subcommands:\n"
             "install-* subcommands are commands that install components\n"
             "list-* subcommands are commands that show available components\n",
             help="Please refer to each help message by using '--help' with each subcommand",
         )
-        self._make_all_parsers(subparsers)
+        self._parser_builders = self._make_parser_builders()
+        self._built_commands: Set[str] = set()
         parser.set_defaults(func=self.show_help)
-        self.parser = parser
+        self._parser = parser
+        # Caches spec -> version resolutions so that recursive installs (autodesktop)
+        # and pre-resolution in `run_install_src` do not refetch identical metadata.
+        self._resolved_versions: Dict[Tuple[str, str, str, str, str], Version] = {}
+        # Caches default desktop arch lookups, which hit the network, per (host, version, is_msvc).
+        self._default_desktop_arches: Dict[Tuple[str, str, bool], str] = {}
+
+    @property
+    def parser(self) -> argparse.ArgumentParser:
+        """The argument parser, with every subcommand registered."""
+        for command in self._parser_builders:
+            self._build_command_parser(command)
+        return self._parser
+
+    def _build_command_parser(self, command: str) -> None:
+        if command not in self._built_commands:
+            self._built_commands.add(command)
+            self._parser_builders[command]()
+
+    @staticmethod
+    def _peek_command(argv: List[str]) -> Optional[str]:
+        """Return the subcommand token from argv, ignoring top-level options."""
+        skip_next = False
+        for token in argv:
+            if skip_next:
+                skip_next = False
+            elif token in ("-c", "--config"):
+                skip_next = True
+            elif not token.startswith("-"):
+                return token
+        return None
 
     def run(self, arg=None) -> int:
-        args = self.parser.parse_args(arg)
+        argv = sys.argv[1:] if arg is None else arg
+        command = self._peek_command(argv)
+        if command in self._parser_builders:
+            # Register only the requested subcommand's parser; unknown commands
+            # and bare `aqt` fall back to building everything so that argparse
+            # can print accurate help and error messages.
+            self._build_command_parser(command)
+            args = self._parser.parse_args(argv)
+        else:
+            args = self.parser.parse_args(argv)
         self._setup_settings(args)
         try:
             args.func(args)
@@ -229,19 +627,16 @@ class Cli:
                 self.logger.warning(f"The py7zr module failed to load. Falling back to '{fallback}' for .7z extraction.")
                 self.logger.warning("You can use the  '--external | -E' flags to select your own extraction tool.")
                 sevenzip = fallback
+            elif Settings.prefer_external_7z and _sevenzip_available(fallback):
+                # py7zr is available, but the external tool extracts large archives faster.
+                return fallback
             else:
                 # Just use py7zr
                 return None
-        try:
-            subprocess.run(
-                [sevenzip, "--help"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
+        if _sevenzip_available(sevenzip):
             return sevenzip
-        except FileNotFoundError as e:
-            qualifier = "Specified" if sevenzip == external else "Fallback"
-            raise CliInputError(f"{qualifier} 7zip command executable does not exist: '{sevenzip}'") from e
+        qualifier = "Specified" if sevenzip == external else "Fallback"
+        raise CliInputError(f"{qualifier} 7zip command executable does not exist: '{sevenzip}'")
 
     @staticmethod
     def _set_arch(arch: Optional[str], os_name: str, target: str, qt_version_or_spec: str) -> str:
@@ -249,13 +644,10 @@ class Cli:
         if arch is not None and arch != "":
             return arch
         if os_name == "linux" and target == "desktop":
-            try:
-                if Version(qt_version_or_spec) >= Version("6.7.0"):
-                    return "linux_gcc_64"
-                else:
-                    return "gcc_64"
-            except ValueError:
-                return "gcc_64"
+            version = _try_parse_version(qt_version_or_spec)
+            if version is not None and version >= Version("6.7.0"):
+                return "linux_gcc_64"
+            return "gcc_64"
         elif os_name == "linux_arm64" and target == "desktop":
             return "linux_gcc_arm64"
         elif os_name == "mac" and target == "desktop":
@@ -263,23 +655,15 @@ class Cli:
         elif os_name == "mac" and target == "ios":
             return "ios"
         elif target == "android":
-            try:
-                if Version(qt_version_or_spec) >= Version("5.14.0"):
-                    return "android"
-            except ValueError:
-                pass
+            version = _try_parse_version(qt_version_or_spec)
+            if version is not None and version >= Version("5.14.0"):
+                return "android"
         elif os_name == "windows_arm64" and target == "desktop":
             return "windows_msvc2022_arm64"
         raise CliInputError("Please supply a target architecture.", should_show_help=True)
 
     def _check_mirror(self, mirror):
-        if mirror is None:
-            pass
-        elif mirror.startswith("http://") or mirror.startswith("https://") or mirror.startswith("ftp://"):
-            pass
-        else:
-            return False
-        return True
+        return mirror is None or _MIRROR_SCHEME_RE.match(mirror) is not None
 
     @staticmethod
     def _determine_qt_version(
@@ -307,8 +691,14 @@ class Cli:
             raise CliInputError(f"Invalid version or SimpleSpec: '{qt_version_or_spec}'\n" + SimpleSpec.usage()) from e
         else:
             version: Optional[Version] = None
-            for ext in QtRepoProperty.possible_extensions_for_arch(arch):
-                version = choose_highest(version, opt_version_for_spec(ext, spec))
+            extensions = QtRepoProperty.possible_extensions_for_arch(arch)
+            if len(extensions) > 1:
+                # The fetches are independent network requests; issue them concurrently.
+                with ThreadPoolExecutor(max_workers=len(extensions)) as executor:
+                    for candidate in executor.map(lambda ext: opt_version_for_spec(ext, spec), extensions):
+                        version = choose_highest(version, candidate)
+            else:
+                version = opt_version_for_spec(extensions[0], spec)
             if not version:
                 raise CliInputError(
                     f"No versions of Qt exist for spec={spec} with host={host}, target={target}, arch={arch}"
@@ -316,6 +706,17 @@ class Cli:
             getLogger("aqt.installer").info(f"Resolved spec '{qt_version_or_spec}' to {version}")
             return version
 
+    def _resolve_qt_version(
+        self, qt_version_or_spec: str, host: str, target: str, arch: str, base_url: str = Settings.baseurl
+    ) -> Version:
+        """Memoized `_determine_qt_version`: identical lookups within one run hit the cache."""
+        key = (qt_version_or_spec, host, target, arch, base_url)
+        if key not in self._resolved_versions:
+            self._resolved_versions[key] = Cli._determine_qt_version(
+                qt_version_or_spec, host, target, arch, base_url=base_url
+            )
+        return self._resolved_versions[key]
+
     @staticmethod
     def choose_archive_dest(archive_dest: Optional[str], keep: bool, temp_dir: str) -> Path:
         """
@@ -334,6 +735,22 @@ class Cli:
         dest.mkdir(parents=True, exist_ok=True)
         return dest
 
+    @staticmethod
+    def _apply_download_cache(keep: bool, archive_dest: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """
+        Redirect downloads to Settings.download_cache_location, when configured.
+
+        The cache only takes effect when the user did not already ask to keep
+        archives somewhere: archives are then kept in the cache directory so a
+        later install of the same packages can reuse them. Cached entries are
+        keyed by archive filename, which Qt keeps unique per package, so no
+        hashed cache keys are needed.
+        """
+        cache_location = Settings.download_cache_location
+        if cache_location and not keep and archive_dest is None:
+            return True, cache_location
+        return keep, archive_dest
+
     def run_install_qt(self, args: InstallArgParser):
         """Run install subcommand"""
         start_time = time.perf_counter()
@@ -345,6 +762,7 @@ class Cli:
         arch: str = self._set_arch(args.arch, os_name, target, qt_version_or_spec)
         keep: bool = args.keep or Settings.always_keep_archives
         archive_dest: Optional[str] = args.archive_dest
+        keep, archive_dest = Cli._apply_download_cache(keep, archive_dest)
         dry_run: bool = args.dry_run
         output_dir = args.outputdir
         if output_dir is None:
@@ -367,7 +785,7 @@ class Cli:
         else:
             base = Settings.baseurl
         if hasattr(args, "qt_version_spec"):
-            qt_version: str = str(Cli._determine_qt_version(args.qt_version_spec, os_name, target, arch, base_url=base))
+            qt_version: str = str(self._resolve_qt_version(args.qt_version_spec, os_name, target, arch, base_url=base))
         else:
             qt_version = args.qt_version
             Cli._validate_version_str(qt_version)
@@ -387,10 +805,8 @@ class Cli:
             commercial_args = InstallArgParser()
 
             # Core parameters required by install-qt-official
-            commercial_args.target = args.target
-            commercial_args.arch = self._set_arch(
-                args.arch, args.host, args.target, getattr(args, "qt_version", getattr(args, "qt_version_spec", ""))
-            )
+            commercial_args.target = target
+            commercial_args.arch = arch
 
             commercial_args.version = qt_version
 
@@ -403,24 +819,24 @@ class Cli:
             # Optional parameters
             commercial_args.email = email or getattr(args, "email", None)
             commercial_args.pw = password or getattr(args, "pw", None)
-            commercial_args.outputdir = args.outputdir
-            commercial_args.modules = args.modules
-            commercial_args.base = getattr(args, "base", None)
-            commercial_args.dry_run = getattr(args, "dry_run", False)
+            commercial_args.outputdir = output_dir
+            commercial_args.modules = modules
+            commercial_args.base = args.base
+            commercial_args.dry_run = dry_run
             commercial_args.override = None
 
             ignored_options = []
-            if getattr(args, "noarchives", False):
+            if args.noarchives:
                 ignored_options.append("--noarchives")
-            if getattr(args, "autodesktop", False):
+            if args.autodesktop:
                 ignored_options.append("--autodesktop")
-            if getattr(args, "archives", None):
+            if args.archives:
                 ignored_options.append("--archives")
-            if getattr(args, "timeout", False):
+            if args.timeout:
                 ignored_options.append("--timeout")
-            if getattr(args, "keep", False):
+            if args.keep:
                 ignored_options.append("--keep")
-            if getattr(args, "archive_dest", False):
+            if args.archive_dest:
                 ignored_options.append("--archive_dest")
 
             if ignored_options:
@@ -510,7 +926,9 @@ class Cli:
                 args.target = "desktop"
                 args.arch = autodesk_arch
 
-                # Run desktop installation first
+                # The desktop installation runs after the primary one rather than
+                # concurrently: both log through the same handlers and users (and
+                # scripts) rely on the two installs reporting in order.
                 self.run_install_qt(desktop_args)
 
             else:
@@ -530,15 +948,17 @@ class Cli:
             base_dir = output_dir
         keep: bool = args.keep or Settings.always_keep_archives
         archive_dest: Optional[str] = args.archive_dest
+        keep, archive_dest = Cli._apply_download_cache(keep, archive_dest)
         if args.base is not None:
             base = args.base
         else:
             base = Settings.baseurl
-        if hasattr(args, "qt_version_spec"):
-            qt_version = str(Cli._determine_qt_version(args.qt_version_spec, os_name, target, arch="", base_url=base))
-        else:
+        if hasattr(args, "qt_version"):
+            # `run_install_src` resolves the version spec before calling this function.
             qt_version = args.qt_version
             Cli._validate_version_str(qt_version)
+        else:
+            qt_version = str(self._resolve_qt_version(args.qt_version_spec, os_name, target, arch="", base_url=base))
         # Override target/os for recent Qt
         if Version(qt_version) in SimpleSpec(">=6.7.0"):
             target = "qt"
@@ -578,7 +998,7 @@ class Cli:
         if not hasattr(args, "qt_version"):
             base = args.base if hasattr(args, "base") else Settings.baseurl
             args.qt_version = str(
-                Cli._determine_qt_version(args.qt_version_spec, args.host, args.target, arch="", base_url=base)
+                self._resolve_qt_version(args.qt_version_spec, args.host, args.target, arch="", base_url=base)
             )
         if args.kde and args.qt_version != "5.15.2":
             raise CliInputError("KDE patch: unsupported version!!")
@@ -619,6 +1039,7 @@ class Cli:
         sevenzip = self._set_sevenzip(args.external)
         keep: bool = args.keep or Settings.always_keep_archives
         archive_dest: Optional[str] = args.archive_dest
+        keep, archive_dest = Cli._apply_download_cache(keep, archive_dest)
         if args.base is not None:
             base = args.base
         else:
@@ -744,6 +1165,8 @@ class Cli:
             modules_ver, modules_query, is_long = None, None, False
 
         for version_str in (modules_ver, args.arch, args.archives[0] if args.archives else None):
+            if version_str is None or version_str == "latest":
+                continue
             Cli._validate_version_str(version_str, allow_latest=True, allow_empty=True)
 
         spec = None
@@ -782,7 +1205,7 @@ class Cli:
 
     def run_list_src_doc_examples(self, args: ListArgumentParser, cmd_type: str):
         target = "desktop"
-        version = Cli._determine_qt_version(args.qt_version_spec, args.host, target, arch="")
+        version = self._resolve_qt_version(args.qt_version_spec, args.host, target, arch="")
         if version >= Version("6.7.0"):
             target = "qt"
             host = "all_os"
@@ -816,7 +1239,7 @@ class Cli:
                     dry_run=args.dry_run,
                 )
             else:
-                if not all([args.target, args.arch, args.version]):
+                if not (args.target and args.arch and args.version):
                     raise CliInputError("target, arch, and version are required")
 
                 commercial_installer = CommercialInstaller(
@@ -844,7 +1267,10 @@ class Cli:
         """Display help message"""
         self.parser.print_help()
 
-    def _format_aqt_version(self) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _format_aqt_version() -> str:
+        # The interpreter details never change within a process; probe them once.
         py_version = platform.python_version()
         py_impl = platform.python_implementation()
         py_build = platform.python_compiler()
@@ -858,12 +1284,12 @@ class Cli:
         install_qt_parser.set_defaults(func=self.run_install_qt)
         install_qt_parser.add_argument(
             "host",
-            choices=["linux", "linux_arm64", "mac", "windows", "windows_arm64", "all_os"],
+            choices=_HOST_CHOICES,
             help="host os name",
         )
         install_qt_parser.add_argument(
             "target",
-            choices=["desktop", "winrt", "android", "ios", "wasm", "qt"],
+            choices=_TARGET_CHOICES,
             help="Target SDK",
         )
         install_qt_parser.add_argument(
@@ -874,25 +1300,7 @@ class Cli:
         install_qt_parser.add_argument(
             "arch",
             nargs="?",
-            help="\ntarget linux/desktop: linux_gcc_64, gcc_64, wasm_32"
-            "\ntarget mac/desktop:   clang_64, wasm_32"
-            "\ntarget mac/ios:       ios"
-            "\nwindows/desktop:      win64_msvc2022_64"
-            "\n                      win64_msvc2019_64, win32_msvc2019"
-            "\n                      win64_msvc2017_64, win32_msvc2017"
-            "\n                      win64_msvc2015_64, win32_msvc2015"
-            "\n                      win64_mingw81, win32_mingw81"
-            "\n                      win64_mingw73, win32_mingw73"
-            "\n                      win32_mingw53"
-            "\n                      wasm_32"
-            "\nwindows/winrt:        win64_msvc2019_winrt_x64, win64_msvc2019_winrt_x86"
-            "\n                      win64_msvc2017_winrt_x64, win64_msvc2017_winrt_x86"
-            "\n                      win64_msvc2019_winrt_armv7"
-            "\n                      win64_msvc2017_winrt_armv7"
-            "\nandroid:              Qt 5.14:          android (optional)"
-            "\n                      Qt 5.13 or below: android_x86_64, android_arm64_v8a"
-            "\n                                        android_x86, android_armv7"
-            "\nall_os/wasm:          wasm_singlethread, wasm_multithread",
+            help=_INSTALL_QT_ARCH_HELP,
         )
         self._set_common_options(install_qt_parser)
         self._set_module_options(install_qt_parser)
@@ -924,13 +1332,13 @@ class Cli:
         install_tool_parser.set_defaults(func=self.run_install_tool)
         install_tool_parser.add_argument(
             "host",
-            choices=["linux", "linux_arm64", "mac", "windows", "windows_arm64", "all_os"],
+            choices=_HOST_CHOICES,
             help="host os name",
         )
         install_tool_parser.add_argument(
             "target",
             default=None,
-            choices=["desktop", "winrt", "android", "ios", "wasm", "qt"],
+            choices=_TARGET_CHOICES,
             help="Target SDK.",
         )
         install_tool_parser.add_argument("tool_name", help="Name of tool such as tools_ifw, tools_mingw")
@@ -956,23 +1364,16 @@ class Cli:
             "input for the official Qt installer",
         )
 
-        # Make standard arguments optional when override is used by adding a custom action
-        class ConditionalRequiredAction(argparse.Action):
-            def __call__(self, parser, namespace, values, option_string=None) -> None:
-                if not hasattr(namespace, "override") or not namespace.override:
-                    setattr(namespace, self.dest, values)
-
-        install_qt_commercial_parser.add_argument(
-            "target",
-            nargs="?",
-            choices=["desktop", "android", "ios"],
-            help="Target platform",
-            action=ConditionalRequiredAction,
-        )
-        install_qt_commercial_parser.add_argument(
-            "arch", nargs="?", help="Target architecture", action=ConditionalRequiredAction
-        )
-        install_qt_commercial_parser.add_argument("version", nargs="?", help="Qt version", action=ConditionalRequiredAction)
+        # Positionals that become optional when --override is used:
+        for name, choices, help_text in (
+            ("target", ["desktop", "android", "ios"], "Target platform"),
+            ("arch", None, "Target architecture"),
+            ("version", None, "Qt version"),
+        ):
+            kwargs = {"choices": choices} if choices else {}
+            install_qt_commercial_parser.add_argument(
+                name, nargs="?", help=help_text, action=_ConditionalRequiredAction, **kwargs
+            )
 
         install_qt_commercial_parser.add_argument(
             "--email",
@@ -1018,13 +1419,13 @@ class Cli:
         # Create temporary directory for installer
         temp_dir = Settings.qt_installer_temp_path
         temp_path = Path(temp_dir)
-        if not temp_path.exists():
-            temp_path.mkdir(parents=True, exist_ok=True)
-        else:
-            Settings.qt_installer_cleanup()
+        # "Do, don't check": mkdir tolerates an existing dir, and cleaning up a
+        # freshly created empty dir is a no-op, so no exists() probe is needed.
+        temp_path.mkdir(parents=True, exist_ok=True)
+        Settings.qt_installer_cleanup()
 
         # Get installer based on OS
-        installer_filename = get_qt_installer_name()
+        installer_filename = _cached_installer_name()
         installer_path = temp_path / installer_filename
 
         try:
@@ -1032,7 +1433,7 @@ class Cli:
             self.logger.info(f"Downloading Qt installer to {installer_path}")
             timeout = (Settings.connection_timeout, Settings.response_timeout)
             download_installer(Settings.baseurl, installer_filename, installer_path, timeout)
-            installer_path = prepare_installer(installer_path, get_os_name())
+            installer_path = prepare_installer(installer_path, _cached_os_name())
 
             # Build command
             cmd = [str(installer_path), "--accept-licenses", "--accept-obligations", "--confirm-command"]
@@ -1074,8 +1475,15 @@ class Cli:
             f"In the future, please omit this parameter."
         )
 
-    def _make_all_parsers(self, subparsers: argparse._SubParsersAction) -> None:
-        """Creates all command parsers and adds them to the subparsers"""
+    def _make_parser_builders(self) -> Dict[str, "Callable[[], None]"]:
+        """
+        Map each subcommand to a builder that registers its parser on demand.
+
+        Registering a subparser runs dozens of add_argument calls and builds
+        large help strings; a single invocation only needs the subcommand it
+        dispatches to, so parsers are built lazily from this table.
+        """
+        subparsers = self._subparsers
 
         def make_parser_it(cmd: str, desc: str, set_parser_cmd, formatter_class):
             kwargs = {"formatter_class": formatter_class} if formatter_class else {}
@@ -1097,7 +1505,7 @@ class Cli:
             parser = subparsers.add_parser(cmd, description=desc)
             parser.add_argument(
                 "host",
-                choices=["linux", "linux_arm64", "mac", "windows", "windows_arm64", "all_os"],
+                choices=_HOST_CHOICES,
                 help="host os name",
             )
             parser.add_argument(
@@ -1110,67 +1518,80 @@ class Cli:
             if cmd_type != "src":
                 parser.add_argument("-m", "--modules", action="store_true", help="Print list of available modules")
 
-        # Create install command parsers
-        make_parser_it("install-qt", "Install Qt.", self._set_install_qt_parser, argparse.RawTextHelpFormatter)
-        make_parser_it("install-tool", "Install tools.", self._set_install_tool_parser, None)
-        make_parser_it(
-            "install-qt-official",
-            "Install Qt with official installer.",
-            self._set_install_qt_commercial_parser,
-            argparse.RawTextHelpFormatter,
-        )
-        make_parser_it(
-            "list-qt-official",
-            "Search packages using Qt official installer.",
-            self._set_list_qt_commercial_parser,
-            argparse.RawTextHelpFormatter,
-        )
-        make_parser_sde("install-doc", "Install documentation.", self.run_install_doc, False)
-        make_parser_sde("install-example", "Install examples.", self.run_install_example, False)
-        make_parser_sde("install-src", "Install source.", self.run_install_src, True, is_add_modules=False)
+        def make_help_parser():
+            help_parser = subparsers.add_parser("help")
+            help_parser.set_defaults(func=self.show_help)
 
-        # Create list command parsers
-        self._make_list_qt_parser(subparsers)
-        self._make_list_tool_parser(subparsers)
-        make_parser_list_sde("list-doc", "List documentation archives available (use with install-doc)", "doc")
-        make_parser_list_sde("list-example", "List example archives available (use with install-example)", "examples")
-        make_parser_list_sde("list-src", "List source archives available (use with install-src)", "src")
+        def make_version_parser():
+            version_parser = subparsers.add_parser("version")
+            version_parser.set_defaults(func=self.show_aqt_version)
 
-        self._make_common_parsers(subparsers)
+        # Insertion order determines the subcommand order in `aqt --help`.
+        return {
+            "install-qt": functools.partial(
+                make_parser_it, "install-qt", "Install Qt.", self._set_install_qt_parser, argparse.RawTextHelpFormatter
+            ),
+            "install-tool": functools.partial(
+                make_parser_it, "install-tool", "Install tools.", self._set_install_tool_parser, None
+            ),
+            "install-qt-official": functools.partial(
+                make_parser_it,
+                "install-qt-official",
+                "Install Qt with official installer.",
+                self._set_install_qt_commercial_parser,
+                argparse.RawTextHelpFormatter,
+            ),
+            "list-qt-official": functools.partial(
+                make_parser_it,
+                "list-qt-official",
+                "Search packages using Qt official installer.",
+                self._set_list_qt_commercial_parser,
+                argparse.RawTextHelpFormatter,
+            ),
+            "install-doc": functools.partial(
+                make_parser_sde, "install-doc", "Install documentation.", self.run_install_doc, False
+            ),
+            "install-example": functools.partial(
+                make_parser_sde, "install-example", "Install examples.", self.run_install_example, False
+            ),
+            "install-src": functools.partial(
+                make_parser_sde, "install-src", "Install source.", self.run_install_src, True, is_add_modules=False
+            ),
+            "list-qt": functools.partial(self._make_list_qt_parser, subparsers),
+            "list-tool": functools.partial(self._make_list_tool_parser, subparsers),
+            "list-doc": functools.partial(
+                make_parser_list_sde, "list-doc", "List documentation archives available (use with install-doc)", "doc"
+            ),
+            "list-example": functools.partial(
+                make_parser_list_sde,
+                "list-example",
+                "List example archives available (use with install-example)",
+                "examples",
+            ),
+            "list-src": functools.partial(
+                make_parser_list_sde, "list-src", "List source archives available (use with install-src)", "src"
+            ),
+            "help": make_help_parser,
+            "version": make_version_parser,
+        }
 
     def _make_list_qt_parser(self, subparsers: argparse._SubParsersAction):
         """Creates a subparser that works with the MetadataFactory, and adds it to the `subparsers` parameter"""
         list_parser: ListArgumentParser = subparsers.add_parser(
             "list-qt",
             formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="Examples:\n"
-            "$ aqt list-qt mac                                                # print all targets for Mac OS\n"
-            "$ aqt list-qt mac desktop                                        # print all versions of Qt 5\n"
-            '$ aqt list-qt mac desktop --spec "5.9"                           # print all versions of Qt 5.9\n'
-            '$ aqt list-qt mac desktop --spec "5.9" --latest-version          # print latest Qt 5.9\n'
-            "$ aqt list-qt mac desktop --modules 5.12.0 clang_64              # print modules for 5.12.0\n"
-            "$ aqt list-qt mac desktop --spec 5.9 --modules latest clang_64   # print modules for latest 5.9\n"
-            "$ aqt list-qt mac desktop --arch 5.9.9                           # print architectures for "
-            "5.9.9/mac/desktop\n"
-            "$ aqt list-qt mac desktop --arch latest                          # print architectures for the "
-            "latest Qt 5\n"
-            "$ aqt list-qt mac desktop --archives 5.9.0 clang_64              # list archives in base Qt "
-            "installation\n"
-            "$ aqt list-qt mac desktop --archives 5.14.0 clang_64 debug_info  # list archives in debug_info "
-            "module\n"
-            "$ aqt list-qt all_os wasm --arch 6.8.1                           # print architectures for Qt WASM "
-            "6.8.1\n",
+            epilog=_LIST_QT_EPILOG,
         )
         list_parser.add_argument(
             "host",
-            choices=["linux", "linux_arm64", "mac", "windows", "windows_arm64", "all_os"],
+            choices=_HOST_CHOICES,
             help="host os name",
         )
         list_parser.add_argument(
             "target",
             nargs="?",
             default=None,
-            choices=["desktop", "winrt", "android", "ios", "wasm", "qt"],
+            choices=_TARGET_CHOICES,
             help="Target SDK. When omitted, this prints all the targets available for a host OS.",
         )
         list_parser.add_argument(
@@ -1252,23 +1673,18 @@ class Cli:
         list_parser: ListArgumentParser = subparsers.add_parser(
             "list-tool",
             formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="Examples:\n"
-            "$ aqt list-tool mac desktop                   # print all tools for mac desktop\n"
-            "$ aqt list-tool mac desktop tools_ifw         # print all tool variant names for QtIFW\n"
-            "$ aqt list-tool mac desktop ifw               # print all tool variant names for QtIFW\n"
-            "$ aqt list-tool mac desktop tools_ifw --long  # print tool variant names with metadata for QtIFW\n"
-            "$ aqt list-tool mac desktop ifw --long        # print tool variant names with metadata for QtIFW\n",
+            epilog=_LIST_TOOL_EPILOG,
         )
         list_parser.add_argument(
             "host",
-            choices=["linux", "linux_arm64", "mac", "windows", "windows_arm64", "all_os"],
+            choices=_HOST_CHOICES,
             help="host os name",
         )
         list_parser.add_argument(
             "target",
             nargs="?",
             default=None,
-            choices=["desktop", "winrt", "android", "ios", "wasm", "qt"],
+            choices=_TARGET_CHOICES,
             help="Target SDK. When omitted, this prints all the targets available for a host OS.",
         )
         list_parser.add_argument(
@@ -1289,12 +1705,6 @@ class Cli:
         )
         list_parser.set_defaults(func=self.run_list_tool)
 
-    def _make_common_parsers(self, subparsers: argparse._SubParsersAction) -> None:
-        help_parser = subparsers.add_parser("help")
-        help_parser.set_defaults(func=self.show_help)
-        version_parser = subparsers.add_parser("version")
-        version_parser.set_defaults(func=self.show_aqt_version)
-
     def _set_common_options(self, subparser: argparse.ArgumentParser) -> None:
         subparser.add_argument(
             "-O",
@@ -1357,13 +1767,13 @@ class Cli:
         """
         subparser.add_argument(
             "host",
-            choices=["linux", "linux_arm64", "mac", "windows", "windows_arm64", "all_os"],
+            choices=_HOST_CHOICES,
             help="host os name",
         )
         if is_target_deprecated:
             subparser.add_argument(
                 "target",
-                choices=["desktop", "winrt", "android", "ios", "wasm", "qt"],
+                choices=_TARGET_CHOICES,
                 nargs="?",
                 help="Ignored. This parameter is deprecated and marked for removal in a future release. "
                 "It is present here for backwards compatibility.",
@@ -1371,7 +1781,7 @@ class Cli:
         else:
             subparser.add_argument(
                 "target",
-                choices=["desktop", "winrt", "android", "ios", "wasm", "qt"],
+                choices=_TARGET_CHOICES,
                 help="target sdk",
             )
         subparser.add_argument(
@@ -1428,19 +1838,18 @@ class Cli:
         :param allow_minus: If true, everything after the first '-' in the version will be ignored.
                             This allows acceptance of versions like "1.2.3-0-202101020304"
         """
-        if allow_latest and version_str == "latest":
-            return
-        if not version_str:
-            if allow_empty:
-                return
-            else:
-                raise CliInputError("Invalid empty version! Please use the form '5.X.Y'.")
-        try:
-            if "-" in version_str and allow_minus:
-                version_str = version_str[: version_str.find("-")]
-            Version(version_str)
-        except ValueError as e:
-            raise CliInputError(f"Invalid version: '{version_str}'! Please use the form '5.X.Y'.") from e
+        error_message = _check_version_str(version_str, allow_latest, allow_empty, allow_minus)
+        if error_message is not None:
+            raise CliInputError(error_message)
+
+    def _fetch_default_desktop_arch(self, host: str, version: Version, is_msvc: bool) -> str:
+        """Memoized MetadataFactory.fetch_default_desktop_arch, which involves a network fetch."""
+        key = (host, str(version), is_msvc)
+        if key not in self._default_desktop_arches:
+            self._default_desktop_arches[key] = MetadataFactory(
+                ArchiveId("qt", host, "desktop")
+            ).fetch_default_desktop_arch(version, is_msvc)
+        return self._default_desktop_arches[key]
 
     def _get_autodesktop_dir_and_arch(
         self,
@@ -1473,9 +1882,7 @@ class Cli:
             return installed_desktop_arch_dir.name, None
 
         try:
-            default_desktop_arch = MetadataFactory(ArchiveId("qt", host, "desktop")).fetch_default_desktop_arch(
-                version, is_msvc
-            )
+            default_desktop_arch = self._fetch_default_desktop_arch(host, version, is_msvc)
         except ValueError as e:
             if "Target 'desktop' is invalid" in str(e):
                 # Special case for all_os host which doesn't support desktop target
@@ -1521,6 +1928,17 @@ def is_64bit() -> bool:
     return sys.maxsize > 1 << 32
 
 
+def _usable_cpu_count() -> int:
+    """Number of CPUs actually available to this process.
+
+    Unlike `os.cpu_count`, this respects cgroup/affinity restrictions in
+    containers and batch schedulers where only a subset of cores is usable.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
 def run_installer(
     archives: List[QtPackage],
     base_dir: str,
@@ -1549,18 +1967,34 @@ def run_installer(
         logger.info(f"Total packages: {len(archives)}")
         return
 
-    queue = multiprocessing.Manager().Queue(-1)
+    # Downloads and extractions already overlap across the worker pool: with
+    # chunksize 1, workers that finish downloading extract while the others are
+    # still fetching, so both the network and the CPUs stay busy without an
+    # async I/O layer. Splitting into a thread pool for downloads feeding a
+    # process pool for extraction would buy the same overlap at the cost of a
+    # handoff queue and a second scheduling layer, so a single pool is kept.
+    ctx = multiprocessing.get_context("spawn")
+    # A raw context queue feeds the listener over a pipe directly, avoiding the
+    # Manager server process and its per-operation round trips. It cannot be
+    # pickled into task arguments, so workers receive it via the pool
+    # initializer instead.
+    queue = ctx.Queue(-1)
     listener = MyQueueListener(queue)
     listener.start()
     #
     tasks = []
-    for arc in archives:
-        tasks.append((arc, base_dir, sevenzip, queue, archive_dest, Settings.configfile, keep))
-    ctx = multiprocessing.get_context("spawn")
+    # Longest-processing-time order: hand out the biggest archives first so a
+    # huge one (e.g. qtwebengine) cannot land at the tail of the run while the
+    # other workers sit idle. The sort is stable, so archives whose size is
+    # unknown keep their original order; starmap's chunksize of 1 already
+    # gives each task to the first free worker.
+    for arc in sorted(archives, key=_estimated_archive_size, reverse=True):
+        tasks.append((arc, base_dir, sevenzip, archive_dest, keep))
+    pool_size = max(1, min(Settings.concurrency, _usable_cpu_count()))
     if is_64bit():
-        pool = ctx.Pool(Settings.concurrency, init_worker_sh, (), 4)
+        pool = ctx.Pool(pool_size, init_worker_sh, (queue, Settings.configfile), 4)
     else:
-        pool = ctx.Pool(Settings.concurrency, init_worker_sh, (), 1)
+        pool = ctx.Pool(pool_size, init_worker_sh, (queue, Settings.configfile), 1)
 
     def close_worker_pool_on_exception(exception: BaseException):
         logger = getLogger("aqt.installer")
@@ -1569,7 +2003,9 @@ def run_installer(
         pool.join()
 
     try:
-        pool.starmap(installer, tasks)
+        # chunksize=1 hands archives to workers one at a time, so while one worker
+        # extracts an archive, the others keep downloading the remaining ones.
+        pool.starmap(installer, tasks, 1)
         pool.close()
         pool.join()
     except PermissionError as e:  # subclass of OSError
@@ -1623,18 +2059,41 @@ def run_installer(
         listener.stop()
 
 
-def init_worker_sh() -> None:
-    """Initialize worker signal handling"""
+# Handler feeding the log queue shared with the parent process; set in each
+# worker by init_worker_sh and reused by every task the worker runs.
+_worker_log_handler = None
+
+
+def init_worker_sh(log_queue=None, settings_ini: Optional[str] = None) -> None:
+    """Initialize a worker process: signal handling, settings and queue logging"""
+    global _worker_log_handler
+    # Ignoring SIGINT here is the portable way to keep Ctrl-C handling in the
+    # parent: multiprocessing.Pool offers no preexec_fn, and process-group
+    # tricks like os.setpgrp do not exist on Windows.
     signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # Workers are recycled after a handful of tasks, so cyclic garbage is
+    # reclaimed at process exit anyway; raise the collection thresholds
+    # rather than paying for full collections between archives.
+    gc.set_threshold(100000, 10, 10)
+    # Settings and logging are configured once per worker process rather than
+    # once per archive; the settings file never changes during a run.
+    if settings_ini is not None:
+        Settings.load_settings(file=settings_ini)
+    if log_queue is not None:
+        setup_logging()
+        logger = getLogger()
+        for handler in logger.handlers:
+            handler.close()
+            logger.removeHandler(handler)
+        _worker_log_handler = BatchingQueueHandler(log_queue)
+        logger.addHandler(_worker_log_handler)
 
 
 def installer(
     qt_package: QtPackage,
     base_dir: str,
     command: Optional[str],
-    queue: multiprocessing.Queue,
     archive_dest: Path,
-    settings_ini: str,
     keep: bool,
 ) -> None:
     """
@@ -1644,60 +2103,112 @@ def installer(
     name = qt_package.name
     base_url = qt_package.base_url
     archive: Path = archive_dest / qt_package.archive
-    base_dir = posixpath.join(base_dir, qt_package.archive_install_path)
+    # The install path comes from the feed as a known-clean relative path;
+    # plain concatenation skips posixpath.join's separator handling.
+    if qt_package.archive_install_path:
+        base_dir = base_dir + "/" + qt_package.archive_install_path
     start_time = time.perf_counter()
-    Settings.load_settings(file=settings_ini)
-    # setup queue logger
-    setup_logging()
-    qh = QueueHandler(queue)
+    qh = _worker_log_handler
     logger = getLogger()
-    for handler in logger.handlers:
-        handler.close()
-        logger.removeHandler(handler)
-    logger.addHandler(qh)
-    #
-    timeout = (Settings.connection_timeout, Settings.response_timeout)
-    hash = get_hash(qt_package.archive_path, Settings.hash_algorithm, timeout) if not Settings.ignore_hash else None
-
-    def download_bin(_base_url):
-        url = posixpath.join(_base_url, qt_package.archive_path)
-        logger.debug("Download URL: {}".format(url))
-        return downloadBinaryFile(url, archive, Settings.hash_algorithm, hash, timeout)
-
-    retry_on_errors(
-        action=lambda: retry_on_bad_connection(download_bin, base_url),
-        acceptable_errors=(ArchiveChecksumError,),
-        num_retries=Settings.max_retries_on_checksum_error,
-        name=f"Downloading {name}",
-    )
-    gc.collect()
+    # Everything from here on logs through the batching handler, so the
+    # finally below delivers any buffered records even when the download
+    # (not just the extraction) fails and the exception tears down the worker.
+    try:
+        # Bind the settings this task needs up front; locals are cheaper than
+        # repeated singleton attribute lookups in the code below.
+        hash_algorithm = Settings.hash_algorithm
+        timeout = (Settings.connection_timeout, Settings.response_timeout)
+        if Settings.ignore_hash:
+            hash = None
+        else:
+            # Fetch the expected hash from the trusted mirrors while the archive
+            # itself downloads; downloadBinaryFile waits for it at verification time.
+            hash_executor = ThreadPoolExecutor(max_workers=1)
+            hash = hash_executor.submit(get_hash, qt_package.archive_path, hash_algorithm, timeout)
+            hash_executor.shutdown(wait=False)
+
+        def download_bin(_base_url):
+            url = f"{_base_url.rstrip('/')}/{qt_package.archive_path}"
+            logger.debug("Download URL: {}".format(url))
+            return downloadBinaryFile(url, archive, hash_algorithm, hash, timeout)
+
+        use_cached = False
+        if hash is not None and archive.is_file():
+            # A previous run with --keep or the download cache may have left this
+            # archive behind; reuse it without downloading when its checksum
+            # matches the one the trusted mirrors advertise.
+            expected = hash.result()
+            use_cached = get_file_hash(archive, hash_algorithm) == expected
+            if use_cached:
+                logger.info("Using cached {}".format(archive.name))
+            else:
+                # Already resolved; downloadBinaryFile accepts plain bytes too.
+                hash = expected
+        if not use_cached:
+            retry_on_errors(
+                action=lambda: retry_on_bad_connection(download_bin, base_url),
+                acceptable_errors=(ArchiveChecksumError,),
+                num_retries=Settings.max_retries_on_checksum_error,
+                name=f"Downloading {name}",
+            )
 
-    if tarfile.is_tarfile(archive):
-        with tarfile.open(archive) as tar_archive:
-            if hasattr(tarfile, "data_filter"):
-                tar_archive.extractall(filter="tar", path=base_dir)
+        # The archive is verified on disk before extraction starts; streaming the
+        # download straight into an extractor — including tarfile's one-pass
+        # 'r|*' mode over the response stream — would hand it bytes whose
+        # checksum has not been confirmed yet.
+        #
+        # Extraction allocates millions of short-lived objects with no reference
+        # cycles; pausing the cyclic collector avoids pointless whole-heap sweeps.
+        gc.disable()
+        kind = _archive_kind(archive)
+        if kind == "tar":
+            tar_command = _system_tar_command(archive, base_dir)
+            if tar_command is not None:
+                os.makedirs(base_dir, exist_ok=True)
+                _run_extraction_command(tar_command, logger)
             else:
-                # remove this when the minimum Python version is 3.12
-                logger.warning("Extracting may be unsafe; consider updating Python to 3.11.4 or greater")
-                tar_archive.extractall(path=base_dir)
-    elif zipfile.is_zipfile(archive):
-        with zipfile.ZipFile(archive) as zip_archive:
-            zip_archive.extractall(path=base_dir)
-    elif command is None:
-        with py7zr.SevenZipFile(archive, "r") as szf:
-            szf.extractall(path=base_dir)
-    else:
-        command_args = [command, "x", "-aoa", "-bd", "-y", "-o{}".format(base_dir), str(archive)]
-        try:
-            proc = subprocess.run(command_args, capture_output=True, check=True, text=True)
-            logger.debug(proc.stdout)
-        except subprocess.CalledProcessError as cpe:
-            msg = "\n".join(filter(None, [f"Extraction error: {cpe.returncode}", cpe.stdout, cpe.stderr]))
-            raise ArchiveExtractionError(msg) from cpe
+                # Map the archive once where possible; member reads then hit
+                # the page-cache mapping instead of issuing independent
+                # buffered reads.
+                # No _precreate_dirs here: listing a compressed tar's members
+                # costs a full decompression pass, and tarfile already creates
+                # directories from its ordered members. Only the zip and 7z
+                # branches, whose member listings are metadata-only, pre-create.
+                with open(archive, "rb") as f:
+                    with _archive_fileobj(f) as fileobj:
+                        with tarfile.open(fileobj=fileobj) as tar_archive:
+                            if hasattr(tarfile, "data_filter"):
+                                tar_archive.extractall(filter="tar", path=base_dir)
+                            else:
+                                # remove this when the minimum Python version is 3.12
+                                logger.warning("Extracting may be unsafe; consider updating Python to 3.11.4 or greater")
+                                tar_archive.extractall(path=base_dir)
+        elif kind == "zip":
+            with open(archive, "rb") as f:
+                with _archive_fileobj(f) as fileobj:
+                    with zipfile.ZipFile(fileobj) as zip_archive:
+                        _precreate_dirs(zip_archive.namelist(), base_dir)
+                        _extract_zip_members(zip_archive, base_dir)
+        elif command is None:
+            if LIBARCHIVE and not Settings.force_pure_python_extractor:
+                _extract_with_libarchive(archive, base_dir)
+            else:
+                with py7zr.SevenZipFile(archive, "r") as szf:
+                    _precreate_dirs(szf.getnames(), base_dir)
+                    szf.extractall(path=base_dir)
+        else:
+            _run_extraction_command([command, "x", "-aoa", "-bd", "-y", "-o{}".format(base_dir), str(archive)], logger)
+    finally:
+        gc.enable()
+        # Deliver anything buffered so far, even when the download or the
+        # extraction failed.
+        qh.flush()
     if not keep:
         os.unlink(archive)
+    else:
+        # A kept archive's bytes will not be read again in this run; release
+        # its page cache so it does not compete with extraction write-back.
+        # (Unlinking already frees the pages in the not-keep case.)
+        _drop_page_cache(archive)
     logger.info("Finished installation of {} in {:.8f}".format(archive.name, time.perf_counter() - start_time))
-    gc.collect()
     qh.flush()
-    qh.close()
-    logger.removeHandler(qh)
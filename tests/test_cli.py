@@ -6,6 +6,7 @@ from typing import Dict, List, Optional
 
 import pytest
 
+import aqt.installer
 from aqt.exceptions import CliInputError
 from aqt.helper import Settings
 from aqt.installer import Cli
@@ -255,12 +256,12 @@ def test_set_7zip_checks_external_tool_when_specified(monkeypatch, capsys, exter
     cli._setup_settings()
     external = "my_7z_extractor"
 
-    def mock_subprocess_run(args, **kwargs):
-        assert args[0] == external
-        if not external_tool_exists:
-            raise FileNotFoundError()
+    def mock_which(cmd):
+        assert cmd == external
+        return f"/usr/bin/{external}" if external_tool_exists else None
 
-    monkeypatch.setattr("aqt.installer.subprocess.run", mock_subprocess_run)
+    aqt.installer._sevenzip_available.cache_clear()
+    monkeypatch.setattr("aqt.installer.shutil.which", mock_which)
     monkeypatch.setattr("aqt.installer.EXT7Z", False)
     if external_tool_exists:
         assert external == cli._set_sevenzip(external)
@@ -277,12 +278,12 @@ def test_set_7zip_uses_fallback_when_py7zr_missing(monkeypatch, capsys, fallback
     cli._setup_settings()
     external, fallback = None, Settings.zipcmd
 
-    def mock_subprocess_run(args, **kwargs):
-        assert args[0] == fallback
-        if not fallback_exists:
-            raise FileNotFoundError()
+    def mock_which(cmd):
+        assert cmd == fallback
+        return f"/usr/bin/{fallback}" if fallback_exists else None
 
-    monkeypatch.setattr("aqt.installer.subprocess.run", mock_subprocess_run)
+    aqt.installer._sevenzip_available.cache_clear()
+    monkeypatch.setattr("aqt.installer.shutil.which", mock_which)
     monkeypatch.setattr("aqt.installer.EXT7Z", True)
     if fallback_exists:
         assert fallback == cli._set_sevenzip(external)
@@ -299,10 +300,11 @@ def test_set_7zip_chooses_p7zr_when_ext_missing(monkeypatch, capsys, fallback_ex
     cli._setup_settings()
     external = None
 
-    def mock_subprocess_run(args, **kwargs):
-        assert False, "Should not try to run anything"
+    def mock_which(cmd):
+        assert False, "Should not probe for any extraction tool"
 
-    monkeypatch.setattr("aqt.installer.subprocess.run", mock_subprocess_run)
+    aqt.installer._sevenzip_available.cache_clear()
+    monkeypatch.setattr("aqt.installer.shutil.which", mock_which)
     monkeypatch.setattr("aqt.installer.EXT7Z", False)
     assert cli._set_sevenzip(external) is None
     assert capsys.readouterr()[1] == ""
@@ -4,15 +4,17 @@ import logging
 import os
 import posixpath
 import re
+import stat
 import subprocess
 import sys
 import tarfile
 import textwrap
+import zipfile
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import py7zr
 import pytest
@@ -20,7 +22,7 @@ import pytest
 from aqt.archives import QtPackage
 from aqt.exceptions import ArchiveDownloadError, ArchiveExtractionError
 from aqt.helper import Settings
-from aqt.installer import Cli, installer
+from aqt.installer import Cli, init_worker_sh, installer
 
 
 class MockMultiprocessingContext:
@@ -38,8 +40,11 @@ class MockMultiprocessingContext:
         pass
 
     class Pool:
-        def __init__(self, *args):
-            pass
+        def __init__(self, processes=None, initializer=None, initargs=(), *args):
+            # Workers run in the main process here, so run the initializer in
+            # the main process too; it wires up the worker log queue.
+            if initializer is not None:
+                initializer(*initargs)
 
         def starmap(self, func: Callable, func_args: List[Tuple], *args):
             for set_of_args in func_args:
@@ -60,16 +65,22 @@ class MockMultiprocessingManager:
         def __init__(self, *args):
             pass
 
-        def put_nowait(self, log_record: Optional[logging.LogRecord]):
+        def put_nowait(self, log_record: Union[None, logging.LogRecord, List[logging.LogRecord]]):
             # NOTE: This is certainly not the right way to do this, but it works locally
-            if not log_record or log_record.levelno < logging.INFO:
-                return
-            print(log_record.message, file=sys.stderr)
+            records = log_record if isinstance(log_record, list) else [log_record]
+            for record in records:
+                if not record or record.levelno < logging.INFO:
+                    continue
+                print(record.message, file=sys.stderr)
 
         def get(self, *args):
             return None
 
 
+# run_installer creates its log queue from the multiprocessing context.
+MockMultiprocessingContext.Queue = MockMultiprocessingManager.Queue
+
+
 GET_URL_TYPE = Callable[[str, Any], str]
 DOWNLOAD_ARCHIVE_TYPE = Callable[[str, str, str, bytes, Any], None]
 LIST_OF_FILES_AND_CONTENTS = Iterable[Dict[str, str]]
@@ -1862,6 +1873,9 @@ def test_install_installer_archive_extraction_err(monkeypatch):
     monkeypatch.setattr("aqt.installer.downloadBinaryFile", lambda *args: None)
     monkeypatch.setattr("aqt.installer.subprocess.run", mock_extractor_that_fails)
 
+    # The pool initializer normally hands the log queue and settings to each worker:
+    init_worker_sh(MockMultiprocessingManager.Queue(), Settings.configfile)
+
     with pytest.raises(ArchiveExtractionError) as err, TemporaryDirectory() as temp_dir:
         with open(Path(temp_dir) / "archive", "w"):
             pass
@@ -1877,9 +1891,7 @@ def test_install_installer_archive_extraction_err(monkeypatch):
             ),
             base_dir=temp_dir,
             command="some_nonexistent_7z_extractor",
-            queue=MockMultiprocessingManager.Queue(),
             archive_dest=Path(temp_dir),
-            settings_ini=Settings.configfile,
             keep=False,
         )
     assert err.type == ArchiveExtractionError
@@ -1887,6 +1899,132 @@ def test_install_installer_archive_extraction_err(monkeypatch):
     assert err_msg == "Extraction error: 1\nout\nerr"
 
 
+def test_install_installer_extracts_zip_with_safe_modes(monkeypatch):
+    def mock_download_zip(url, out, *args):
+        with zipfile.ZipFile(out, "w") as zip_archive:
+            exe_info = zipfile.ZipInfo("bin/tool")
+            exe_info.external_attr = (stat.S_IFREG | 0o4755) << 16  # setuid + executable
+            zip_archive.writestr(exe_info, "content")
+            zip_archive.writestr("docs/readme.txt", "hello")
+
+    monkeypatch.setattr("aqt.installer.get_hash", lambda *args, **kwargs: b"")
+    monkeypatch.setattr("aqt.installer.downloadBinaryFile", mock_download_zip)
+
+    init_worker_sh(MockMultiprocessingManager.Queue(), Settings.configfile)
+
+    with TemporaryDirectory() as temp_dir:
+        installer(
+            qt_package=QtPackage(
+                "name",
+                "base_url",
+                "archive_path",
+                "archive.zip",
+                "",
+                "package_desc",
+                "pkg_update_name",
+            ),
+            base_dir=temp_dir,
+            command=None,
+            archive_dest=Path(temp_dir),
+            keep=False,
+        )
+        extracted = Path(temp_dir) / "bin" / "tool"
+        assert extracted.read_text() == "content"
+        assert (Path(temp_dir) / "docs" / "readme.txt").read_text() == "hello"
+        if sys.platform != "win32":
+            # Permission bits are applied, but setuid/setgid/sticky are stripped.
+            assert (extracted.stat().st_mode & 0o7777) == 0o755
+
+
+def test_install_installer_reuses_cached_archive(monkeypatch):
+    downloads: List[str] = []
+
+    def mock_download(url, *args):
+        downloads.append(url)
+
+    with TemporaryDirectory() as temp_dir:
+        archive = Path(temp_dir) / "archive.zip"
+        with zipfile.ZipFile(archive, "w") as zip_archive:
+            zip_archive.writestr("data.txt", "cached")
+        expected_hash = hashlib.sha256(archive.read_bytes()).digest()
+
+        monkeypatch.setattr("aqt.installer.get_hash", lambda *args, **kwargs: expected_hash)
+        monkeypatch.setattr("aqt.installer.downloadBinaryFile", mock_download)
+
+        init_worker_sh(MockMultiprocessingManager.Queue(), Settings.configfile)
+
+        installer(
+            qt_package=QtPackage(
+                "name",
+                "base_url",
+                "archive_path",
+                "archive.zip",
+                "",
+                "package_desc",
+                "pkg_update_name",
+            ),
+            base_dir=temp_dir,
+            command=None,
+            archive_dest=Path(temp_dir),
+            keep=True,
+        )
+        # The matching checksum means the on-disk archive was used as-is:
+        assert downloads == []
+        assert archive.is_file()
+        assert (Path(temp_dir) / "data.txt").read_text() == "cached"
+
+
+def test_install_installer_redownloads_stale_archive(monkeypatch):
+    downloads: List[str] = []
+
+    def mock_download(url, out, *args):
+        downloads.append(url)
+        with zipfile.ZipFile(out, "w") as zip_archive:
+            zip_archive.writestr("data.txt", "fresh")
+
+    with TemporaryDirectory() as temp_dir:
+        archive = Path(temp_dir) / "archive.zip"
+        archive.write_bytes(b"stale or truncated leftovers")
+
+        monkeypatch.setattr("aqt.installer.get_hash", lambda *args, **kwargs: hashlib.sha256(b"fresh bytes").digest())
+        monkeypatch.setattr("aqt.installer.downloadBinaryFile", mock_download)
+
+        init_worker_sh(MockMultiprocessingManager.Queue(), Settings.configfile)
+
+        installer(
+            qt_package=QtPackage(
+                "name",
+                "base_url",
+                "archive_path",
+                "archive.zip",
+                "",
+                "package_desc",
+                "pkg_update_name",
+            ),
+            base_dir=temp_dir,
+            command=None,
+            archive_dest=Path(temp_dir),
+            keep=False,
+        )
+        # The checksum mismatch forces a fresh download of the archive:
+        assert len(downloads) == 1
+        assert (Path(temp_dir) / "data.txt").read_text() == "fresh"
+
+
+def test_install_apply_download_cache_precedence():
+    Settings.config.set("aqt", "download_cache_location", "dl_cache")
+    try:
+        # The cache only engages when neither --keep nor --archives-dest is set:
+        assert Cli._apply_download_cache(False, None) == (True, "dl_cache")
+        assert Cli._apply_download_cache(True, None) == (True, None)
+        assert Cli._apply_download_cache(False, "some/dest") == (False, "some/dest")
+        assert Cli._apply_download_cache(True, "some/dest") == (True, "some/dest")
+    finally:
+        Settings.config.set("aqt", "download_cache_location", "")
+    # An empty location (the default) disables the cache entirely:
+    assert Cli._apply_download_cache(False, None) == (False, None)
+
+
 @pytest.mark.parametrize(
     "cmd, host, target, version, arch, arch_dir, base_url, updates_url, archives, expect_out",
     (
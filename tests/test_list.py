@@ -1071,8 +1071,10 @@ def test_show_list_long_qt_modules(capsys, monkeypatch, columns: int, use_cli: b
 
     cli = Cli()
 
-    # Patching get_terminal_size prevents successful instantiation of Cli, so do it afterwards:
-    monkeypatch.setattr(shutil, "get_terminal_size", lambda fallback: os.terminal_size((columns, 24)))
+    # Patching get_terminal_size prevents successful instantiation of Cli, so do it afterwards.
+    # Subcommand parsers are registered lazily during `cli.run`, and argparse calls
+    # get_terminal_size with no arguments while doing so, hence the default fallback:
+    monkeypatch.setattr(shutil, "get_terminal_size", lambda fallback=(80, 24): os.terminal_size((columns, 24)))
 
     if use_cli:
         return_code = cli.run("list-qt windows desktop --long-modules 5.14.0 win32_mingw73".split())